@@ -135,10 +135,10 @@ def parallel_function(
                 t_max=dict_t_max[dataset_name])
             print(log_alpha_opt)
 
-    monitor.times = np.array(monitor.times).copy()
-    monitor.objs = np.array(monitor.objs).copy()
-    monitor.objs_test = np.array(monitor.objs_test).copy()
-    monitor.log_alphas = np.array(monitor.log_alphas).copy()
+    monitor.times = np.asarray(monitor.times)
+    monitor.objs = np.asarray(monitor.objs)
+    monitor.objs_test = np.asarray(monitor.objs_test)
+    monitor.log_alphas = np.asarray(monitor.log_alphas)
     return (dataset_name, method, tol, n_outer, tolerance_decrease,
             monitor.times, monitor.objs, monitor.objs_test,
             monitor.log_alphas, norm(y_val), norm(y_test), log_alpha_max)
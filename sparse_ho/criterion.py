@@ -1,10 +1,11 @@
 from numpy.linalg import norm
 import numpy as np
 from scipy.sparse import issparse
+from scipy.special import expit
 from sklearn.model_selection import check_cv
 from sklearn.utils import check_random_state
 
-from sparse_ho.utils import sigma, smooth_hinge
+from sparse_ho.utils import smooth_hinge
 from sparse_ho.utils import derivative_smooth_hinge
 from sparse_ho.forward import get_beta_jac_iterdiff
 
@@ -80,9 +81,11 @@ class HeldOutMSE():
             self.rmse = None
 
     def get_val(self, log_alpha, tol=1e-3):
-        # TODO add warm start
         mask, dense, _ = get_beta_jac_iterdiff(
-            self.model.X, self.model.y, log_alpha, self.model, tol=tol, compute_jac=False)
+            self.model.X, self.model.y, log_alpha, self.model,
+            mask0=self.mask0, dense0=self.dense0, tol=tol, compute_jac=False)
+        self.mask0 = mask
+        self.dense0 = dense
         self.value_test(mask, dense)
         return self.value(mask, dense)
 
@@ -138,21 +141,21 @@ class HeldOutLogistic():
         self.rmse = None
 
     def get_v(self, mask, dense):
-        temp = sigma(self.y_val * (self.X_val[:, mask] @ dense))
+        temp = expit(self.y_val * (self.X_val[:, mask] @ dense))
         v = self.X_val[:, mask].T @ (self.y_val * (temp - 1))
         v /= self.X_val.shape[0]
         return v
 
     def value(self, mask, dense):
         val = np.sum(
-            np.log(1 + np.exp(-self.y_val * (self.X_val[:, mask] @ dense))))
+            np.logaddexp(0, -self.y_val * (self.X_val[:, mask] @ dense)))
         val /= self.X_val.shape[0]
         return val
 
     def value_test(self, mask, dense):
         if self.X_test is not None and self.y_test is not None:
             self.val_test = np.sum(
-                np.log(1 + np.exp(-self.y_test * (self.X_test[:, mask] @ dense))))
+                np.logaddexp(0, -self.y_test * (self.X_test[:, mask] @ dense)))
             self.val_test /= self.X_test.shape[0]
         else:
             self.val_test = None
@@ -166,9 +169,11 @@ class HeldOutLogistic():
             self.rmse = None
 
     def get_val(self, log_alpha, tol=1e-3):
-        # TODO add warm start
         mask, dense, _ = get_beta_jac_iterdiff(
-            self.model.X, self.model.y, log_alpha, self.model, tol=tol, compute_jac=False)
+            self.model.X, self.model.y, log_alpha, self.model,
+            mask0=self.mask0, dense0=self.dense0, tol=tol, compute_jac=False)
+        self.mask0 = mask
+        self.dense0 = dense
         self.value_test(mask, dense)
         return self.value(mask, dense)
 
@@ -289,7 +294,10 @@ class HeldOutSmoothedHinge():
     def get_val(self, log_alpha, tol=1e-3):
         mask, dense, _ = get_beta_jac_iterdiff(
             self.model.X, self.model.y, log_alpha, self.model,
+            mask0=self.mask0, dense0=self.dense0,
             max_iter=self.model.max_iter, tol=tol, compute_jac=False)
+        self.mask0 = mask
+        self.dense0 = dense
         mask, dense = self.model.get_primal(mask, dense)
         val = self.value(mask, dense)
         self.value_test(mask, dense)
@@ -381,14 +389,18 @@ class SURE():
             self.rmse = None
 
     def get_val(self, log_alpha, tol=1e-3):
-        # TODO add warm start
         mask, dense, _ = get_beta_jac_iterdiff(
             self.model.X, self.model.y, log_alpha, self.model,
             tol=tol, mask0=self.mask0, dense0=self.dense0, compute_jac=False)
         mask2, dense2, _ = get_beta_jac_iterdiff(
             self.model.X, self.model.y + self.epsilon * self.delta,
             log_alpha, self.model,
-            tol=tol, compute_jac=False)
+            tol=tol, mask0=self.mask02, dense0=self.dense02,
+            compute_jac=False)
+        self.mask0 = mask
+        self.dense0 = dense
+        self.mask02 = mask2
+        self.dense02 = dense2
 
         val = self.value(mask, dense, mask2, dense2)
 
@@ -23,6 +23,11 @@ def get_data(dataset_name, csr=False):
         X_val = X_val.tocsc()
         X_test = X_test.tocsc()
 
+    # sorted indices are a precondition for several scipy.sparse fast paths
+    X_train.sort_indices()
+    X_val.sort_indices()
+    X_test.sort_indices()
+
     print("Finished loading data: %s ..." % dataset_name)
 
     return X_train, X_val, X_test, y_train, y_val, y_test
@@ -32,6 +32,32 @@ class Forward():
         return mask, dense, jac_v, jac
 
 
+def _as_contiguous(X, model):
+    """Return X in the layout expected by the BCD kernels of the model.
+
+    The BCD kernels stream contiguous column (resp. row) slabs: Fortran
+    order for dense X, model.sparse_format for sparse X. The converted
+    copy is cached on the model so the O(n_samples * n_features) copy is
+    not paid again at every outer iteration on the same input.
+    """
+    if issparse(X):
+        if X.getformat() == model.sparse_format:
+            return X
+    elif np.isfortran(X):
+        return X
+    # keep a reference to the source array: an id-based key could silently
+    # match a new array reusing the id of a garbage-collected one
+    if getattr(model, '_X_src', None) is X:
+        return model._X_contiguous
+    if issparse(X):
+        X_contiguous = X.asformat(model.sparse_format)
+    else:
+        X_contiguous = np.asfortranarray(X)
+    model._X_src = X
+    model._X_contiguous = X_contiguous
+    return X_contiguous
+
+
 def get_beta_jac_iterdiff(
         X, y, log_alpha, model, mask0=None, dense0=None, jac0=None,
         max_iter=1000, tol=1e-3, compute_jac=True, return_all=False,
@@ -41,7 +67,7 @@ def get_beta_jac_iterdiff(
     --------------
     X: np.array, shape (n_samples, n_features)
         design matrix
-        It can also be a sparse CSC matrix
+        It can also be a sparse CSC matrix, preferably with sorted indices
     y: np.array, shape (n_samples,)
         observations
     log_alpha: float or np.array, shape (n_features)
@@ -69,8 +95,7 @@ def get_beta_jac_iterdiff(
     """
     n_samples, n_features = X.shape
     is_sparse = issparse(X)
-    if not is_sparse and not np.isfortran(X):
-        X = np.asfortranarray(X)
+    X = _as_contiguous(X, model)
     L = model.get_L(X, is_sparse=is_sparse)
 
     ############################################
@@ -96,39 +121,52 @@ def get_beta_jac_iterdiff(
 
     pobj0 = model._get_pobj0(r, np.zeros(X.shape[1]), alphas, y)
     # pobj0 = model._get_pobj(r, np.zeros(X.shape[1]), alphas, y)
-    pobj = []
-    # pobj.append(pobj0)
+    tol_crit = np.abs(pobj0 * tol)
+    pobj_prev = pobj_cur = np.inf
     ############################################
     # store the iterates if needed
-    if return_all:
-        list_beta = []
-    if save_iterates:
-        list_beta = []
-        list_jac = []
+    store_iterates = return_all or save_iterates
+    if store_iterates:
+        # iterates are written in place in arrays grown by doubling, the
+        # worst case (max_iter, n_features) is too large to preallocate
+        capacity = min(max_iter, 128)
+        betas = np.empty((capacity, n_features), dtype=beta.dtype)
+        if save_iterates:
+            jacs = np.empty((capacity,) + dbeta.shape, dtype=dbeta.dtype)
+    n_stored = 0
+    # bind the update function and its constant arguments once instead of
+    # re-dispatching on the sparsity at every iteration
+    if is_sparse:
+        update_fn = model._update_beta_jac_bcd_sparse
+        update_args = (X.data, X.indptr, X.indices, y, n_samples, n_features)
+    else:
+        update_fn = model._update_beta_jac_bcd
+        update_args = (X, y)
     # print(tol)
     for i in range(max_iter):
         if verbose:
             print("%i -st iteration over %i" % (i, max_iter))
-        if is_sparse:
-            model._update_beta_jac_bcd_sparse(
-                X.data, X.indptr, X.indices, y, n_samples, n_features, beta,
-                dbeta, r, dr, alphas, L, compute_jac=compute_jac)
-        else:
-            model._update_beta_jac_bcd(
-                X, y, beta, dbeta, r, dr, alphas, L, compute_jac=compute_jac)
+        update_fn(
+            *update_args, beta, dbeta, r, dr, alphas, L,
+            compute_jac=compute_jac)
 
-        pobj.append(model._get_pobj(r, beta, alphas, y))
+        pobj_prev, pobj_cur = pobj_cur, model._get_pobj(r, beta, alphas, y)
 
         if i > 1:
             if verbose:
-                print("relative decrease = ", (pobj[-2] - pobj[-1]) / pobj0)
-        if (i > 1) and (pobj[-2] - pobj[-1] <= np.abs(pobj0 * tol)):
+                print("relative decrease = ", (pobj_prev - pobj_cur) / pobj0)
+        if (i > 1) and (pobj_prev - pobj_cur <= tol_crit):
             break
-        if return_all:
-            list_beta.append(beta.copy())
-        if save_iterates:
-            list_beta.append(beta.copy())
-            list_jac.append(dbeta.copy())
+        if store_iterates:
+            if n_stored == capacity:
+                capacity = min(max_iter, 2 * capacity)
+                betas = np.resize(betas, (capacity,) + betas.shape[1:])
+                if save_iterates:
+                    jacs = np.resize(jacs, (capacity,) + jacs.shape[1:])
+            betas[n_stored] = beta
+            if save_iterates:
+                jacs[n_stored] = dbeta
+            n_stored += 1
     else:
         if verbose:
             print('did not converge !')
@@ -138,10 +176,11 @@ def get_beta_jac_iterdiff(
 
     jac = model._get_jac(dbeta, mask)
 
+    # copy so the returned iterates do not pin the whole storage
     if save_iterates:
-        return np.array(list_beta), np.array(list_jac)
+        return betas[:n_stored].copy(), jacs[:n_stored].copy()
     if return_all:
-        return mask, dense, list_beta
+        return mask, dense, betas[:n_stored].copy()
     else:
         if compute_jac:
             return mask, dense, jac
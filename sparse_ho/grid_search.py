@@ -21,6 +21,16 @@ def grid_search(
         if nb_hyperparam == 2:
             log_alphas = np.array(np.meshgrid(log_alphas, log_alphas)).T.reshape(-1, 2)
 
+    elif samp == "grid" and nb_hyperparam == 1:
+        # sweep user-provided grids from the most to the least regularized
+        # so each fit warm starts from the previous, close solution along
+        # the path (the criterion keeps mask0 / dense0 between calls)
+        log_alphas = np.asarray(log_alphas)
+        if reverse:
+            log_alphas = -np.sort(-log_alphas)
+        else:
+            log_alphas = np.sort(log_alphas)
+
     elif samp == "random":
         rng = np.random.RandomState(random_state)
         log_alphas = rng.uniform(
@@ -47,6 +57,9 @@ def grid_search(
         log_alphas[log_alphas > log_alpha_max] = log_alpha_max
     min_g_func = np.inf
     log_alpha_opt = log_alphas[0]
+    # random samplers can propose numerically identical points, cache past
+    # evaluations to avoid refitting on repeats
+    past_evals = {}
 
     if nb_hyperparam == 2:
         n_try = max_evals ** 2
@@ -59,15 +72,22 @@ def grid_search(
             log_alpha = log_alphas[i]
         if samp == "lhs":
             log_alpha = log_alpha[0]
-        g_func, grad_lambda = criterion.get_val_grad(
-            log_alpha, algo.get_beta_jac_v, tol=tol, beta_star=beta_star, compute_jac=False)
+        key = np.asarray(log_alpha).round(6).tobytes()
+        if key in past_evals:
+            g_func, val_test, rmse = past_evals[key]
+        else:
+            g_func, grad_lambda = criterion.get_val_grad(
+                log_alpha, algo.get_beta_jac_v, tol=tol, beta_star=beta_star,
+                compute_jac=False)
+            val_test = criterion.val_test
+            rmse = criterion.rmse
+            past_evals[key] = (g_func, val_test, rmse)
 
         if g_func < min_g_func:
             min_g_func = g_func
             log_alpha_opt = log_alpha
 
-        monitor(g_func, criterion.val_test, log_alpha, None,
-                criterion.rmse)
+        monitor(g_func, val_test, log_alpha, None, rmse)
         if monitor.times[-1] > t_max:
             break
     return log_alpha_opt, min_g_func
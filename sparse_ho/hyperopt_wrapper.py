@@ -4,6 +4,7 @@
 # License: BSD (3-clause)
 
 
+import numpy as np
 from hyperopt import hp
 from hyperopt import fmin, tpe, rand
 from sklearn.utils import check_random_state
@@ -14,12 +15,22 @@ def hyperopt_wrapper(
         tol=1e-5, beta_star=None, random_state=42, t_max=1000,
         method='bayesian'):
 
+    # the bayesian sampler often re-queries near-duplicate points, cache
+    # past evaluations to avoid refitting on repeats
+    past_evals = {}
+
     def objective(log_alpha):
-        val_func, _ = criterion.get_val_grad(
-            log_alpha, algo.get_beta_jac_v, tol=tol, beta_star=beta_star, compute_jac=False)
-        monitor(
-            val_func, criterion.val_test, log_alpha, None,
-            criterion.rmse)
+        key = np.asarray(log_alpha).round(6).tobytes()
+        if key in past_evals:
+            val_func, val_test, rmse = past_evals[key]
+        else:
+            val_func, _ = criterion.get_val_grad(
+                log_alpha, algo.get_beta_jac_v, tol=tol, beta_star=beta_star,
+                compute_jac=False)
+            val_test = criterion.val_test
+            rmse = criterion.rmse
+            past_evals[key] = (val_func, val_test, rmse)
+        monitor(val_func, val_test, log_alpha, None, rmse)
         return val_func
 
     space = hp.uniform(
@@ -1,7 +1,7 @@
 import numpy as np
 from numpy.linalg import norm
 from scipy.sparse import issparse, identity
-from scipy.sparse.linalg import cg
+from scipy.sparse.linalg import cg, svds
 from sparse_ho.utils import init_dbeta0_new
 from sparse_ho.forward import get_beta_jac_iterdiff
 
@@ -75,7 +75,14 @@ def get_beta_jac_t_v_implicit(
         print("Matrix to invert was badly conditioned")
         size_mat = mat_to_inv.shape[0]
         if is_sparse:
-            reg_amount = 1e-7 * norm(model.reduce_X(mask).todense(), ord=2) ** 2
+            # spectral norm of the restricted X without densifying it,
+            # svds needs k < min(shape) so tiny supports go dense
+            Xs = model.reduce_X(mask)
+            if min(Xs.shape) <= 1:
+                reg_amount = 1e-7 * norm(Xs.todense(), ord=2) ** 2
+            else:
+                reg_amount = 1e-7 * svds(
+                    Xs, k=1, return_singular_vectors=False)[0] ** 2
             mat_to_inv += reg_amount * identity(size_mat)
         else:
             reg_amount = 1e-7 * norm(model.reduce_X(mask), ord=2) ** 2
@@ -66,6 +66,8 @@ def get_only_jac(
     n_samples, n_features = Xs.shape
 
     is_sparse = issparse(Xs)
+    if is_sparse and Xs.getformat() != model.sparse_format:
+        Xs = Xs.asformat(model.sparse_format)
     L = model.get_L(Xs, is_sparse)
 
     objs = []
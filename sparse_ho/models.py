@@ -6,6 +6,7 @@ from sparse_ho.utils import proj_box_svm, ind_box, compute_grad_proj
 from sparse_ho.utils import sigma
 import scipy.sparse.linalg as slinalg
 from scipy.sparse import issparse, csc_matrix
+from scipy.special import expit
 
 
 class Lasso():
@@ -26,6 +27,8 @@ class Lasso():
         logarithm of alpha_max if already precomputed
     """
 
+    sparse_format = "csc"
+
     def __init__(
             self, X, y, max_iter=1000, estimator=None, log_alpha_max=None):
         self.X = X
@@ -56,53 +59,70 @@ class Lasso():
         return beta, r
 
     @staticmethod
-    @njit
+    @njit(nogil=True)
     def _update_beta_jac_bcd(
             X, y, beta, dbeta, r, dr, alpha, L, compute_jac=True):
         n_samples, n_features = X.shape
         non_zeros = np.where(L != 0)[0]
 
-        for j in non_zeros:
-            beta_old = beta[j]
-            if compute_jac:
+        # the compute_jac branch is hoisted out of the sweep so each
+        # specialized loop is branch-free over the features
+        if compute_jac:
+            for j in non_zeros:
+                beta_old = beta[j]
                 dbeta_old = dbeta[j]
                 # compute derivatives
-            zj = beta[j] + r @ X[:, j] / (L[j] * n_samples)
-            beta[j] = ST(zj, alpha[j] / L[j])
-            # beta[j:j+1] = ST(zj, alpha[j] / L[j])
-            if compute_jac:
+                zj = beta[j] + r @ X[:, j] / (L[j] * n_samples)
+                beta[j] = ST(zj, alpha[j] / L[j])
                 dzj = dbeta[j] + X[:, j] @ dr / (L[j] * n_samples)
                 dbeta[j:j+1] = np.abs(np.sign(beta[j])) * dzj
                 dbeta[j:j+1] -= alpha[j] * np.sign(beta[j]) / L[j]
                 # update residuals
                 dr -= X[:, j] * (dbeta[j] - dbeta_old)
-            r -= X[:, j] * (beta[j] - beta_old)
+                r -= X[:, j] * (beta[j] - beta_old)
+        else:
+            for j in non_zeros:
+                beta_old = beta[j]
+                zj = beta[j] + r @ X[:, j] / (L[j] * n_samples)
+                beta[j] = ST(zj, alpha[j] / L[j])
+                r -= X[:, j] * (beta[j] - beta_old)
 
     @staticmethod
-    @njit
+    @njit(nogil=True)
     def _update_beta_jac_bcd_sparse(
             data, indptr, indices, y, n_samples, n_features, beta,
             dbeta, r, dr, alphas, L, compute_jac=True):
 
         non_zeros = np.where(L != 0)[0]
 
-        for j in non_zeros:
-            # get the j-st column of X in sparse format
-            Xjs = data[indptr[j]:indptr[j+1]]
-            # get the non zero indices
-            idx_nz = indices[indptr[j]:indptr[j+1]]
-            beta_old = beta[j]
-            if compute_jac:
+        # the compute_jac branch is hoisted out of the sweep so each
+        # specialized loop is branch-free over the features
+        if compute_jac:
+            for j in non_zeros:
+                # get the j-st column of X in sparse format
+                Xjs = data[indptr[j]:indptr[j+1]]
+                # get the non zero indices
+                idx_nz = indices[indptr[j]:indptr[j+1]]
+                beta_old = beta[j]
                 dbeta_old = dbeta[j]
-            zj = beta[j] + r[idx_nz] @ Xjs / (L[j] * n_samples)
-            beta[j:j+1] = ST(zj, alphas[j] / L[j])
-            if compute_jac:
+                zj = beta[j] + r[idx_nz] @ Xjs / (L[j] * n_samples)
+                beta[j:j+1] = ST(zj, alphas[j] / L[j])
                 dzj = dbeta[j] + Xjs @ dr[idx_nz] / (L[j] * n_samples)
                 dbeta[j:j+1] = np.abs(np.sign(beta[j])) * dzj
                 dbeta[j:j+1] -= alphas[j] * np.sign(beta[j]) / L[j]
                 # update residuals
                 dr[idx_nz] -= Xjs * (dbeta[j] - dbeta_old)
-            r[idx_nz] -= Xjs * (beta[j] - beta_old)
+                r[idx_nz] -= Xjs * (beta[j] - beta_old)
+        else:
+            for j in non_zeros:
+                # get the j-st column of X in sparse format
+                Xjs = data[indptr[j]:indptr[j+1]]
+                # get the non zero indices
+                idx_nz = indices[indptr[j]:indptr[j+1]]
+                beta_old = beta[j]
+                zj = beta[j] + r[idx_nz] @ Xjs / (L[j] * n_samples)
+                beta[j:j+1] = ST(zj, alphas[j] / L[j])
+                r[idx_nz] -= Xjs * (beta[j] - beta_old)
 
     @staticmethod
     @njit
@@ -164,7 +184,7 @@ class Lasso():
             return jac_v0
 
     @staticmethod
-    @njit
+    @njit(nogil=True)
     def _update_only_jac(Xs, y, r, dbeta, dr, L, alpha, sign_beta):
         n_samples, n_features = Xs.shape
         for j in range(n_features):
@@ -175,7 +195,7 @@ class Lasso():
             dr -= Xs[:, j] * (dbeta[j] - dbeta_old)
 
     @staticmethod
-    @njit
+    @njit(nogil=True)
     def _update_only_jac_sparse(
             data, indptr, indices, y, n_samples, n_features,
             dbeta, r, dr, L, alpha, sign_beta):
@@ -286,6 +306,8 @@ class WeightedLasso():
         logarithm of alpha_max if already precomputed
     """
 
+    sparse_format = "csc"
+
     def __init__(
             self, X, y, max_iter=1000, estimator=None, log_alpha_max=None):
         self.X = X
@@ -315,7 +337,7 @@ class WeightedLasso():
         return beta, r
 
     @staticmethod
-    @njit
+    @njit(nogil=True)
     def _update_beta_jac_bcd(
             X, y, beta, dbeta, r, dr, alpha, L, compute_jac=True):
         n_samples, n_features = X.shape
@@ -336,7 +358,7 @@ class WeightedLasso():
             r -= X[:, j] * (beta[j] - beta_old)
 
     @staticmethod
-    @njit
+    @njit(nogil=True)
     def _update_beta_jac_bcd_sparse(
             data, indptr, indices, y, n_samples, n_features, beta,
             dbeta, r, dr, alphas, L, compute_jac=True):
@@ -413,7 +435,7 @@ class WeightedLasso():
             return jac_v0
 
     @staticmethod
-    @njit
+    @njit(nogil=True)
     def _update_only_jac(Xs, y, r, dbeta, dr, L, alpha, sign_beta):
         n_samples, n_features = Xs.shape
         for j in range(n_features):
@@ -424,7 +446,7 @@ class WeightedLasso():
             dr -= np.outer(Xs[:, j], (dbeta[j, :] - dbeta_old))
 
     @staticmethod
-    @njit
+    @njit(nogil=True)
     def _update_only_jac_sparse(
             data, indptr, indices, y, n_samples, n_features, dbeta, r, dr, L,
             alpha, sign_beta):
@@ -543,6 +565,8 @@ class SVM():
     TODO: other parameters should be remove
     """
 
+    sparse_format = "csr"
+
     def __init__(self, X, y, logC, max_iter=100, tol=1e-3):
         self.logC = logC
         self.max_iter = max_iter
@@ -580,7 +604,7 @@ class SVM():
         return beta, r
 
     @staticmethod
-    @njit
+    @njit(nogil=True)
     def _update_beta_jac_bcd(
             X, y, beta, dbeta, r, dr, C, L, compute_jac=True):
         """
@@ -606,7 +630,7 @@ class SVM():
                 dr += (dbeta[j] - dbeta_old) * y[j] * X[j, :]
 
     @staticmethod
-    @njit
+    @njit(nogil=True)
     def _update_beta_jac_bcd_sparse(
             data, indptr, indices, y, n_samples, n_features, beta,
             dbeta, r, dr, C, L, compute_jac=True):
@@ -685,7 +709,7 @@ class SVM():
             return np.sum(y * dbeta * X.T, axis=1)
 
     @staticmethod
-    @njit
+    @njit(nogil=True)
     def _update_only_jac(Xs, ys, r, dbeta, dr, L, C, sign_beta):
         for j in np.arange(0, Xs.shape[0])[sign_beta == 0.0]:
             dF = ys[j] * np.sum(dr * Xs[j, :])
@@ -695,7 +719,7 @@ class SVM():
             dr += (dbeta[j] - dbeta_old) * ys[j] * Xs[j, :]
 
     @staticmethod
-    @njit
+    @njit(nogil=True)
     def _update_only_jac_sparse(
             data, indptr, indices, y, n_samples, n_features,
             dbeta, r, dr, L, C, sign_beta):
@@ -879,6 +903,8 @@ class SparseLogreg():
     TODO: other parameters should be remove
     """
 
+    sparse_format = "csc"
+
     def __init__(
             self, X, y, max_iter=1000, estimator=None, log_alpha_max=None):
         self.X = X
@@ -908,7 +934,7 @@ class SparseLogreg():
         return beta, r
 
     @staticmethod
-    @njit
+    @njit(nogil=True)
     def _update_beta_jac_bcd(
             X, y, beta, dbeta, r, dr, alpha, L, compute_jac=True):
         n_samples, n_features = X.shape
@@ -934,7 +960,7 @@ class SparseLogreg():
                 dr += y * X[:, j] * (dbeta[j] - dbeta_old)
 
     @staticmethod
-    @njit
+    @njit(nogil=True)
     def _update_beta_jac_bcd_sparse(
             data, indptr, indices, y, n_samples, n_features, beta,
             dbeta, r, dr, alphas, L, compute_jac=True):
@@ -1035,7 +1061,7 @@ class SparseLogreg():
             return jac_v0
 
     @staticmethod
-    @njit
+    @njit(nogil=True)
     def _update_only_jac(Xs, y, r, dbeta, dr, L, alpha, sign_beta):
         n_samples, n_features = Xs.shape
         for j in range(n_features):
@@ -1052,7 +1078,7 @@ class SparseLogreg():
             dr += y * Xs[:, j] * (dbeta[j] - dbeta_old)
 
     @staticmethod
-    @njit
+    @njit(nogil=True)
     def _update_only_jac_sparse(
             data, indptr, indices, y, n_samples, n_features,
             dbeta, r, dr, L, alpha, sign_beta):
@@ -1118,7 +1144,7 @@ class SparseLogreg():
 
     def get_hessian(self, mask, dense, log_alpha):
         a = self.y * (self.X[:, mask] @ dense)
-        temp = sigma(a) * (1 - sigma(a))
+        temp = expit(a) * (1 - expit(a))
         is_sparse = issparse(self.X)
         if is_sparse:
             hessian = csc_matrix(
@@ -1172,6 +1198,8 @@ class SVR():
     TODO: other parameters should be remove
     """
 
+    sparse_format = "csr"
+
     def __init__(self, X, y, logC, log_epsilon, max_iter=100, tol=1e-3):
         self.hyperparam = np.array([logC, log_epsilon])
         self.max_iter = max_iter
@@ -1253,7 +1281,7 @@ class SVR():
                     dr[:, 1] -= (dbeta[j, 1] - dbeta_old[1]) * X[j - n_samples, :]
 
     @staticmethod
-    @njit
+    @njit(nogil=True)
     def _update_beta_jac_bcd_sparse(
             data, indptr, indices, y, n_samples, n_features, beta,
             dbeta, r, dr, C, L, compute_jac=True):
@@ -1330,7 +1358,7 @@ class SVR():
             return X.T @ dbeta
 
     @staticmethod
-    @njit
+    @njit(nogil=True)
     def _update_only_jac(Xs, ys, r, dbeta, dr, L, hyperparam, sign_beta):
         supp = np.where(sign_beta == 0.0)
         dbeta[sign_beta == 1.0, :] = np.array([hyperparam[0], 0])
@@ -1351,7 +1379,7 @@ class SVR():
                 dr -= (dbeta[j, :] - dbeta_old) * Xs[j - n_samples, :]
 
     @staticmethod
-    @njit
+    @njit(nogil=True)
     def _update_only_jac_sparse(
             data, indptr, indices, y, n_samples, n_features,
             dbeta, r, dr, L, C, sign_beta):
@@ -1523,6 +1551,8 @@ class SVR():
 
 
 class ElasticNet():
+    sparse_format = "csc"
+
     def __init__(
             self, X, y, max_iter=1000, estimator=None, log_alpha_max=None):
         self.X = X
@@ -1553,7 +1583,7 @@ class ElasticNet():
         return beta, r
 
     @staticmethod
-    @njit
+    @njit(nogil=True)
     def _update_beta_jac_bcd(
             X, y, beta, dbeta, r, dr, alpha, L, compute_jac=True):
         n_samples, n_features = X.shape
@@ -1576,7 +1606,7 @@ class ElasticNet():
             r -= X[:, j] * (beta[j] - beta_old)
 
     @staticmethod
-    @njit
+    @njit(nogil=True)
     def _update_beta_jac_bcd_sparse(
             data, indptr, indices, y, n_samples, n_features, beta,
             dbeta, r, dr, alphas, L, compute_jac=True):
@@ -1676,7 +1706,7 @@ class ElasticNet():
             return jac_v0
 
     @staticmethod
-    @njit
+    @njit(nogil=True)
     def _update_only_jac(Xs, y, r, dbeta, dr, L, alpha, beta):
         n_samples, n_features = Xs.shape
         for j in range(n_features):
@@ -1691,7 +1721,7 @@ class ElasticNet():
             dr[:, 1] -= Xs[:, j] * (dbeta[j, 1] - dbeta_old[1])
 
     @staticmethod
-    @njit
+    @njit(nogil=True)
     def _update_only_jac_sparse(
             data, indptr, indices, y, n_samples, n_features,
             dbeta, r, dr, L, alpha, beta):
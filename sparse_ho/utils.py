@@ -1,16 +1,18 @@
 import time
 import numpy as np
 from numba import njit
+from scipy.sparse import issparse
 
 
 @njit
 def ST(x, alpha):
-    return np.sign(x) * np.maximum(np.abs(x) - alpha, 0.)
+    # copysign instead of sign * maximum lowers to branchless code
+    return np.copysign(np.maximum(np.abs(x) - alpha, 0.), x)
 
 
 @njit
 def prox_elasticnet(x, alpha_1, alpha_2):
-    return (1 / (1 + (alpha_2))) * ST(x, alpha_1)
+    return np.copysign(np.maximum(np.abs(x) - alpha_1, 0.), x) / (1. + alpha_2)
 
 
 @njit
@@ -38,48 +40,81 @@ def sigma(z):
     return 1 / (1 + np.exp(-z))
 
 
+@njit
+def _mcp_pen_vec(x, threshold, gamma):
+    z = np.empty(x.shape[0])
+    clip = 0.5 * threshold ** 2 * gamma
+    for i in range(x.shape[0]):
+        if np.abs(x[i]) < gamma * threshold:
+            z[i] = threshold * np.abs(x[i]) - x[i] ** 2 / (2 * gamma)
+        else:
+            z[i] = clip
+    return z
+
+
 def mcp_pen(x, threshold, gamma=1.2):
     """ penalty value for mcp regularization
         Remind that gamma > 1
     """
     if isinstance(x, np.ndarray):
-        z = (0.5 * threshold ** 2 * gamma) * np.ones(x.shape)
-        j = np.abs(x) < gamma * threshold
-        z[j] = threshold * np.abs(x[j]) - x[j] ** 2 / (2 * gamma)
-    else:
-        z = (0.5 * threshold ** 2 * gamma)
-        if np.abs(x) < gamma * threshold:
-            z = threshold * np.abs(x) - x ** 2 / (2 * gamma)
+        return _mcp_pen_vec(x, threshold, gamma)
+    z = (0.5 * threshold ** 2 * gamma)
+    if np.abs(x) < gamma * threshold:
+        z = threshold * np.abs(x) - x ** 2 / (2 * gamma)
     return z
 
 
+@njit
 def smooth_hinge(x):
-    val = np.zeros(len(x))
-    val[x <= 0.0] = 0.5 - x[x <= 0.0]
-    boole = np.logical_and(x > 0.0, x <= 1)
-    val[boole] = 0.5 * (1 - x[boole]) ** 2
-
+    val = np.zeros(x.shape[0])
+    for i in range(x.shape[0]):
+        xi = x[i]
+        if xi <= 0.:
+            val[i] = 0.5 - xi
+        elif xi <= 1.:
+            val[i] = 0.5 * (1. - xi) ** 2
     return val
 
 
+@njit
 def derivative_smooth_hinge(x):
-    deriv = np.zeros(len(x))
-    deriv[x <= 0.0] = -1.0
-    boole = np.logical_and(x > 0.0, x <= 1)
-    deriv[boole] = -1.0 + x[boole]
+    deriv = np.zeros(x.shape[0])
+    for i in range(x.shape[0]):
+        xi = x[i]
+        if xi <= 0.:
+            deriv[i] = -1.
+        elif xi <= 1.:
+            deriv[i] = xi - 1.
     return deriv
 
 
+@njit
+def smooth_hinge_valderiv(x, out_val, out_deriv):
+    """Fused value / derivative of the smooth hinge, one pass over x."""
+    for i in range(x.shape[0]):
+        xi = x[i]
+        if xi <= 0.:
+            out_val[i] = 0.5 - xi
+            out_deriv[i] = -1.
+        elif xi <= 1.:
+            out_val[i] = 0.5 * (1. - xi) ** 2
+            out_deriv[i] = xi - 1.
+        else:
+            out_val[i] = 0.
+            out_deriv[i] = 0.
+
+
 def smooth_hinge_loss(X, y, beta):
-    n_samples, n_features = X.shape
-    val = 0
-    grad = np.zeros(n_features)
-    for i in range(n_samples):
-        val += smooth_hinge((X[i, :].T @ beta) * y[i])
-        grad += derivative_smooth_hinge(
-            (X[i, :].T @ beta) * y[i]) * X[i, :] * y[i]
-    val /= X.shape[0]
-    grad /= X.shape[0]
+    n_samples = X.shape[0]
+    margin = (X @ beta) * y
+    val = np.empty(n_samples)
+    deriv = np.empty(n_samples)
+    smooth_hinge_valderiv(margin, val, deriv)
+    val = np.sum(val) / n_samples
+    if issparse(X):
+        grad = np.asarray(X.T @ (deriv * y)).ravel() / n_samples
+    else:
+        grad = X.T @ (deriv * y) / n_samples
     return val, grad
 
 
@@ -116,57 +151,52 @@ def mcp_dx(x, alpha, gamma):
         return np.abs(np.sign(x)) / (1 - 1 / gamma)
 
 
-@njit
 def init_dbeta0_new_p(jac0, mask, mask_old):
     mask_both = np.logical_and(mask_old, mask)
     size_mat = mask.sum()
+    idx_new = (np.cumsum(mask) - 1)[mask_both]
+    idx_old = (np.cumsum(mask_old) - 1)[mask_both]
     dbeta0_new = np.zeros((size_mat, size_mat))
-    count = 0
-    count_old = 0
-    n_features = mask.shape[0]
-    for j in range(n_features):
-        if mask_both[j]:
-            dbeta0_new[count, :] = init_dbeta0_new(
-                jac0[count_old, :], mask, mask_old)
-        if mask_old[j]:
-            count_old += 1
-        if mask[j]:
-            count += 1
+    dbeta0_new[np.ix_(idx_new, idx_new)] = jac0[np.ix_(idx_old, idx_old)]
     return dbeta0_new
 
 
-@njit
 def init_dbeta0_new(dbeta0, mask, mask_old):
-    # dbeta0_new = np.zeros(mask.shape[0])
-    # dbeta0_new[mask_old] = dbeta0
-    # # import ipdb; ipdb.set_trace()
-    # return dbeta0_new[mask]
     mask_both = np.logical_and(mask_old, mask)
     size_mat = mask.sum()
+    idx_new = (np.cumsum(mask) - 1)[mask_both]
+    idx_old = (np.cumsum(mask_old) - 1)[mask_both]
+    # dbeta0 can be shorter than the old support (e.g. the solution of the
+    # reduced linear system on the SVM implicit path), keep only the
+    # entries for which a value was stored
+    keep = idx_old < dbeta0.shape[0]
     dbeta0_new = np.zeros(size_mat)
-    count = 0
-    count_old = 0
-    n_features = mask.shape[0]
-    for j in range(n_features):
-        if mask_both[j]:
-            dbeta0_new[count] = dbeta0[count_old]
-        if mask_old[j]:
-            count_old += 1
-        if mask[j]:
-            count += 1
+    dbeta0_new[idx_new[keep]] = dbeta0[idx_old[keep]]
     return dbeta0_new
 
 
+# number of set bits for every byte value, used for fast popcounts
+_popcount_lut = np.array(
+    [bin(byte).count("1") for byte in range(256)], dtype=np.int64)
+
+
+def pack_support(supp):
+    """Pack a boolean support into a uint8 bitmask, 8 features per byte."""
+    return np.packbits(np.asarray(supp, dtype=bool))
+
+
+def iou_packed(packed1, packed2):
+    inter = _popcount_lut[packed1 & packed2].sum()
+    union = _popcount_lut[packed1 | packed2].sum()
+    return inter / union
+
+
 def iou(supp1, supp2):
-    return np.logical_and(
-        supp1, supp2).sum() / np.logical_or(supp1, supp2).sum()
+    return iou_packed(pack_support(supp1), pack_support(supp2))
 
 
 def iou_beta(beta1, beta2):
-    supp1 = beta1 != 0
-    supp2 = beta2 != 0
-    return np.logical_and(
-        supp1, supp2).sum() / np.logical_or(supp1, supp2).sum()
+    return iou(beta1 != 0, beta2 != 0)
 
 
 class Monitor():
@@ -174,10 +204,13 @@ class Monitor():
     Class used to store computed metrics at each iteration of the outer loop.
     """
     def __init__(self):
-        self.t0 = time.time()
+        self.t0 = time.perf_counter()
         self.objs = []
         self.objs_test = []
-        self.times = []
+        self._capacity = 128
+        self._n_calls = 0
+        self._times = np.empty(self._capacity)
+        self.times = self._times[:0]
         self.log_alphas = []
         self.grads = []
         self.rmse = []
@@ -190,7 +223,13 @@ class Monitor():
             self.log_alphas.append(log_alpha.copy())
         except Exception:
             self.log_alphas.append(log_alpha)
-        self.times.append(time.time() - self.t0)
+        if self._n_calls == self._capacity:
+            self._capacity *= 2
+            self._times = np.resize(self._times, self._capacity)
+        self._times[self._n_calls] = time.perf_counter() - self.t0
+        self._n_calls += 1
+        # view on the filled entries, so self.times behaves as before
+        self.times = self._times[:self._n_calls]
         self.grads.append(grad)
         self.rmse.append(rmse)
 